@@ -0,0 +1,68 @@
+# Signup throughput with passwords hashed in the process pool versus in the request thread, and how
+# many cheap GET /products requests other threads get through meanwhile.
+#
+#     python benchmarks/password_hashing.py [--signups 64] [--threads 16]
+#
+# Runs against a throwaway SQLite database through the Flask test client.
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+import app as ecommerce
+
+def run_signups(client, prefix, signups, threads):
+    def signup(i):
+        response = client.post('/customers', json={'name': 'Bench', 'email': f'{prefix}{i}@example.com',
+                                                   'phone': '1234567890', 'address': 'x',
+                                                   'username': f'{prefix}{i}', 'password': 'secret123'})
+        assert response.status_code == 201, response.json
+
+    reads = [0]
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            client.get('/products/1')
+            reads[0] += 1
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(signup, range(signups)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    reader.join()
+    return signups / elapsed, reads[0] / elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--signups', type=int, default=64)
+    parser.add_argument('--threads', type=int, default=16)
+    args = parser.parse_args()
+
+    client = ecommerce.app.test_client()
+    client.post('/products', json={'name': 'Bench', 'price': 1, 'stock': 1})
+    hasher = ecommerce.password_hasher
+    print(f"scrypt n={ecommerce.app.config['PASSWORD_HASH_N']}, {hasher.workers} pool workers, "
+          f"{args.signups} signups from {args.threads} threads")
+
+    # Warm the pool up so worker start up isn't counted.
+    hasher.hash('warm up')
+    signups, reads = run_signups(client, 'pool', args.signups, args.threads)
+    print(f'process pool:   {signups:8.1f} signups/s {reads:8.1f} reads/s')
+
+    hasher.run = lambda fn, *fn_args: fn(*fn_args)
+    signups, reads = run_signups(client, 'inline', args.signups, args.threads)
+    print(f'request thread: {signups:8.1f} signups/s {reads:8.1f} reads/s')
+
+if __name__ == '__main__':
+    main()
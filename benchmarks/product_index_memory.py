@@ -0,0 +1,62 @@
+# Memory and load time of the product catalog held as Product ORM objects, as plain dicts and in the
+# columnar ProductIndex, measured with tracemalloc.
+#
+#     python benchmarks/product_index_memory.py [--products 200000]
+#
+# Runs against a throwaway SQLite database filled with generated products.
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+import app as ecommerce
+
+def measure(load):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = load()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return loaded, size, elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--products', type=int, default=200000)
+    args = parser.parse_args()
+
+    db = ecommerce.db
+    with ecommerce.app.app_context():
+        ecommerce.create_tables()
+        db.session.execute(db.insert(ecommerce.Product),
+                           [{'name': f'Product number {i}', 'price': i / 7, 'stock': i % 500, 'version_id': 1}
+                            for i in range(args.products)])
+        db.session.commit()
+
+        results = []
+        orm_objects, size, elapsed = measure(lambda: ecommerce.Product.query.all())
+        results.append(('ORM objects', size, elapsed))
+        del orm_objects
+        db.session.expunge_all()
+
+        dicts, size, elapsed = measure(lambda: [product._asdict() for product in ecommerce.product_rows()])
+        results.append(('plain dicts', size, elapsed))
+        del dicts
+
+        _, size, elapsed = measure(ecommerce.product_index.load)
+        results.append(('ProductIndex', size, elapsed))
+
+    print(f'{args.products} products')
+    for label, size, elapsed in results:
+        print(f'{label:>12}: {size / args.products:7.0f} bytes/product {size / 2 ** 20:8.1f} MiB, loaded in {elapsed:.2f}s')
+
+if __name__ == '__main__':
+    main()
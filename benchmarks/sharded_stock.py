@@ -0,0 +1,62 @@
+# Checkout throughput on one hot product with its stock in the products row versus split over
+# product_stock_shards rows.
+#
+#     python benchmarks/sharded_stock.py [--orders 400] [--threads 32] [--shards 8]
+#
+# Row locks only matter on a database that has them, so point FLASK_SQLALCHEMY_DATABASE_URI at a
+# scratch MySQL database for meaningful numbers; without it a throwaway SQLite file is used, which
+# serializes every write and only checks that both paths sell exactly the stock they had.
+
+import argparse
+import datetime
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('FLASK_SQLALCHEMY_DATABASE_URI', 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+os.environ.setdefault('FLASK_STOCK_REBALANCE_INTERVAL', '0')
+
+import app as ecommerce
+
+def run_orders(client, customer_id, product_id, orders, threads):
+    order_date = datetime.date.today().isoformat()
+
+    def order(_):
+        return client.post('/orders', json={'customer_id': customer_id, 'order_date': order_date,
+                                            'order_items': [{'product_id': product_id, 'quantity': 1}]}).status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        statuses = Counter(executor.map(order, range(orders)))
+    return statuses, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--orders', type=int, default=400)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--shards', type=int, default=8)
+    args = parser.parse_args()
+
+    client = ecommerce.app.test_client()
+    client.post('/customers', json={'name': 'Bench', 'email': 'bench@example.com', 'phone': '1234567890',
+                                    'address': 'x', 'username': 'bench', 'password': 'secret123'})
+    customer_id = client.post('/login', json={'username': 'bench', 'password': 'secret123'}).json['customer_id']
+    print(f'{args.orders} single-unit orders from {args.threads} threads')
+    for shards in (0, args.shards):
+        client.post('/products', json={'name': f'Hot {shards}', 'price': 1, 'stock': args.orders})
+        with ecommerce.app.app_context():
+            product_id = ecommerce.db.session.query(ecommerce.db.func.max(ecommerce.Product.id)).scalar()
+        client.put(f'/products/{product_id}/stock_shards', json={'shards': shards})
+        statuses, elapsed = run_orders(client, customer_id, product_id, args.orders, args.threads)
+        with ecommerce.app.app_context():
+            stock = ecommerce.product_stock(ecommerce.db.session.get(ecommerce.Product, product_id))
+        label = f'{shards} shards' if shards else 'single row'
+        print(f'{label:>12}: {args.orders / elapsed:8.1f} orders/s, responses {dict(statuses)}, '
+              f'stock left {stock} (expected {args.orders - statuses[201]})')
+
+if __name__ == '__main__':
+    main()
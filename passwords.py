@@ -0,0 +1,36 @@
+import base64
+import hashlib
+import hmac
+import os
+
+# These functions run inside the password hashing process pool, so this module only imports the
+# standard library and stays cheap to load in the worker processes.
+
+PREFIX = 'scrypt'
+
+def hash_password(password, n, r, p):
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=max_memory(n, r, p), dklen=32)
+    return '$'.join([PREFIX, str(n), str(r), str(p),
+                     base64.b64encode(salt).decode(), base64.b64encode(digest).decode()])
+
+def verify_password(password, stored):
+    if not is_hashed(stored):
+        return hmac.compare_digest(password.encode(), stored.encode())
+    _, n, r, p, salt, digest = stored.split('$')
+    n, r, p = int(n), int(r), int(p)
+    expected = base64.b64decode(digest)
+    actual = hashlib.scrypt(password.encode(), salt=base64.b64decode(salt), n=n, r=r, p=p,
+                            maxmem=max_memory(n, r, p), dklen=len(expected))
+    return hmac.compare_digest(actual, expected)
+
+def needs_rehash(stored, n, r, p):
+    if not is_hashed(stored):
+        return True
+    return stored.split('$')[1:4] != [str(n), str(r), str(p)]
+
+def is_hashed(stored):
+    return stored.startswith(PREFIX + '$')
+
+def max_memory(n, r, p):
+    return 128 * r * (n + p + 2) + 1024 * 1024